@@ -17,10 +17,98 @@ try:
 except ImportError:
     from collections import MutableSet     # Python < 3.10
 from collections import namedtuple
+from functools import lru_cache
+from array import array
+import bisect
 import copy
+import csv
+import io
 import re
 from pathlib import Path
 
+# Matches whitespace in a tier name.
+_RE_WS = re.compile(r'\s')
+
+# Regexes for praat_long TextGrid files. Only the keywords and numbers they
+# match are ASCII; quoted strings such as tier names can hold any text.
+_PRAAT_CLASS_RE = re.compile(r'class = "(.+)"', re.ASCII)
+_PRAAT_NAME_RE = re.compile(r'name = "(.*)"', re.ASCII)
+_PRAAT_XMIN_RE = re.compile(r'xmin = (-?[\d.]+)', re.ASCII)
+_PRAAT_XMAX_RE = re.compile(r'xmax = (-?[\d.]+)', re.ASCII)
+_PRAAT_SIZE_RE = re.compile(r'(?:intervals|points): size = (\d+)', re.ASCII)
+# Match the start of a label, from its "intervals|points [n]:" line up to the
+# opening quote of its text, capturing t1 and (for intervals) t2.
+_PRAAT_POINT_RE = re.compile(
+    r'[^\n]*\n'
+    r'[^\n]*?(?:xmin|number) = (\S+)[^\n]*\n'
+    r'[^\S\n]*(?:text|mark) = "',
+    re.ASCII
+)
+_PRAAT_INTERVAL_RE = re.compile(
+    r'[^\n]*\n'
+    r'[^\n]*?(?:xmin|number) = (\S+)[^\n]*\n'
+    r'[^\n]*?xmax = (\S+)[^\n]*\n'
+    r'[^\S\n]*(?:text|mark) = "',
+    re.ASCII
+)
+# Matches the first line following the text of a label, which starts the next
+# label or tier. Searched for in a whole-file buffer, so whitespace must not
+# match across lines.
+_PRAAT_END_LABEL_RE = re.compile(
+    r'^[^\S\n]*(item|intervals|points)[^\S\n]*\[\d+\]:?',
+    re.ASCII | re.MULTILINE
+)
+_PRAAT_ITEM_RE = re.compile(r'^\s*item\s*\[\d+\]:?', re.ASCII)
+
+# Regexes for praat_short TextGrid files.
+# Indicates end of a label for lines that include opening double quote.
+_PRAAT_SHORT_LABEND_RE = re.compile(
+    r'''
+        (?:^"|[^"])
+        (?:"")*      # Allow even number of preceding double quotes (Praat's way of including quotation marks in label content)
+        "            # Line terminates with double quote
+        \s*          # Ignore whitespace
+        $
+        |            # OR
+        ^\s*"\s*$    # Only double quote and optional whitespace
+    ''',
+    re.VERBOSE
+)
+# Indicates end of a label for lines that do not include opening double
+# quote, i.e. end of a multiline label text.
+_PRAAT_SHORT_MLABEND_RE = re.compile(
+    r'''
+        (?:^|[^"])
+        (?:"")*      # Allow even number of preceding double quotes (Praat's way of including quotation marks in label content)
+        "            # Line terminates with double quote
+        \s*          # Ignore whitespace
+        $
+        |            # OR
+        ^\s*"\s*$    # Only double quote and optional whitespace
+    ''',
+    re.VERBOSE
+)
+# Matches a label line that is exactly quotation marks.
+_PRAAT_SHORT_ONLYQUOTE_RE = re.compile('^(?:"")+$')
+
+# Regexes for ESPS label files, to identify the 'separator' header line,
+# end-of-header line, and the time, color, and content fields of body lines.
+# Empty and comment lines do not match the body regex.
+_ESPS_SEPARATOR_RE = re.compile(r'separator\s+(.+)')
+_ESPS_END_HEAD_RE = re.compile(r'^#')
+_ESPS_ROW_RE = re.compile(
+    r'^[^\S\n]*([^\s#]\S*)(?:[^\S\n]+(\S+)(?:[^\S\n]+(.*))?)?',
+    re.MULTILINE
+)
+
+# Regex for the fields of a wavesurfer label line: t1, t2, and the label
+# text, which may contain whitespace. Blank lines and lines with fewer than
+# three fields do not match.
+_WAVESURFER_ROW_RE = re.compile(
+    r'^[^\S\n]*(\S+)[^\S\n]+(\S+)[^\S\n]+(.*\S)',
+    re.MULTILINE
+)
+
 def read_label(fname, ftype, codec=None, tiers=None, addcols=[],
     return_lm=False, stop_on_error=True, ignore_index=True):
     '''Read one or more label files and extract specified tiers as a list of
@@ -142,11 +230,23 @@ used to read the label file.
                 sys.stderr.write(e.msg())
                 continue
         for idx, tr in enumerate(tlist):
-            tr = tr.assign(**assigndict)
-            dflist[idx].append(tr)
-
-    # Make a list of tier DataFrames.
-    dfs = [pd.concat(lst, ignore_index=ignore_index) for lst in dflist]
+            dflist[idx].append((tr, assigndict))
+
+    # Make a list of tier DataFrames. The extra columns are added once to
+    # each concatenated DataFrame, with each file's values repeated for its
+    # rows, rather than assigned to each file's DataFrame separately. They
+    # are inserted after the columns of the first file's DataFrame, which is
+    # where concatenating the assigned DataFrames would put them.
+    dfs = []
+    for lst in dflist:
+        df = pd.concat([tr for tr, toss in lst], ignore_index=ignore_index)
+        lens = [len(tr) for tr, toss in lst]
+        loc = len(lst[0][0].columns)
+        for k in lst[0][1]:
+            vals = np.repeat(np.array([ad[k] for toss, ad in lst]), lens)
+            df.insert(loc, k, vals)
+            loc += 1
+        dfs.append(df)
 
     # Rename column containing label text content.
     # If the tier parameter was not used, do not attempt to determine
@@ -553,9 +653,55 @@ def df2tg(dfs, tnames, lbl=None, t1='t1', t2='t2', ftype='praat_short',
 
 # Some convenience functions to be used in the classes.
 
+# Remove a single leading and trailing double quote, if present.
+def _strip_praat_quotes(s):
+    if s.startswith('"'):
+        s = s[1:]
+    if s.endswith('"'):
+        s = s[:-1]
+    return s
+
+# Return the line of buf that starts at position pos, including its newline,
+# and the position of the following line. The line is '' at the end of buf.
+def _next_line(buf, pos):
+    end = buf.find('\n', pos) + 1
+    if end == 0:
+        end = len(buf)
+    return (buf[pos:end], end)
+
 # Strip white space at edges, remove surrounding quotes, and unescape quotes.
+# Most labels are quoted and have no escaped quotes, so check for those cases
+# before falling back to the general handling.
 def _clean_praat_string(s):
-    return re.sub('""', '"', re.sub('^"|"$', '', s.strip()))
+    s = s.strip()
+    if len(s) > 1 and s[0] == '"' and s[-1] == '"':
+        s = s[1:-1]
+    else:
+        s = _strip_praat_quotes(s)
+    return s.replace('""', '"') if '""' in s else s
+
+# Format a sequence of times for Praat output.
+def _format_praat_times(times):
+    return [f'{t:1.20f}' for t in times]
+
+# Return a namedtuple class with fields named for the tiers. The class is
+# cached so that repeated calls to labels_at() do not recreate it.
+@lru_cache(maxsize=64)
+def _ret_namedtuple(names):
+    return namedtuple('Ret', ' '.join(names))
+
+# Return the raw contents of the file at path.
+def _read_raw(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+# Decode raw file contents as open() in text mode would.
+def _decode(raw, codec):
+    return io.TextIOWrapper(io.BytesIO(raw), encoding=codec).read()
+
+# Return the decoded text of the file at path.
+def _read_decoded(path, codec):
+    return _decode(_read_raw(path), codec)
 
 class LabelError(Exception):
     """Base class for errors in this module."""
@@ -587,7 +733,9 @@ class LabelManagerParseError(LabelError):
 # TODO: make content unicode-capable
 class Label(object):
     """An individual annotation."""
-    
+
+    __slots__ = ('_t1', '_t2', 'text', 'codec', 'appdata')
+
     def __init__(self, text='', t1=None, t2=None, appdata=None, metadata=None,
                  codec='utf-8', *args, **kwargs):
         super(Label, self).__init__()
@@ -611,15 +759,10 @@ class Label(object):
             t2str = ''
         else:
             t2str = "t2={t2:0.4f}, ".format(t2=self._t2)
-        text = self.text
-        try:
-            text = self.text.encode(self.codec)
-        except NameError:
-            pass
         return "Label( t1={t1:0.4f}, {t2}text='{text}' )".format(
             t1=self._t1,
             t2=t2str,
-            text=text
+            text=self.text
         )
         
 
@@ -631,13 +774,47 @@ class Label(object):
             t2str = "<b>t2</b>={t2:0.4f}, ".format(t2=self._t2)
         return "<b>Label</b>( <b>t1</b>={t1:0.4f}, {t2}<b>text</b>='{text}' )".format(t1=self._t1,t2=t2str,text=self.text)
 
-    def _scale_by(self, factor):
-        self._t1 *= factor
-        if self._t2 != None: self._t2 *= factor
-        
-    def _shift_by(self, t):
-        self._t1 += t
-        if self._t2 != None: self._t2 += t
+    def copy(self):
+        """Return a copy of the Label. The appdata attribute is deep-copied."""
+        label = copy.copy(self)
+        if label.appdata is not None:
+            label.appdata = copy.deepcopy(label.appdata)
+        return label
+
+    @classmethod
+    def _from_times(cls, text, t1, t2, appdata=None, codec='utf-8'):
+        """Create a Label from times that are already float (or None for t2)
+without the argument checks and conversions done by __init__(). Used by the
+readers, which parse the times themselves."""
+        label = cls.__new__(cls)
+        label._t1 = t1
+        label._t2 = t2
+        label.text = text
+        label.codec = codec
+        label.appdata = appdata
+        return label
+
+    @classmethod
+    def _list_from_times(cls, texts, t1s, t2s, codec='utf-8', appdatas=None):
+        """Create a list of Labels from parallel sequences of texts, t1 times
+and t2 times, and optionally appdata values, in the same way as
+_from_times(), in a single loop. Equal texts share a single str object."""
+        if appdatas is None:
+            appdatas = [None] * len(texts)
+        new = cls.__new__
+        # Label texts repeat heavily; store one str object per distinct text.
+        intern = {}.setdefault
+        labels = []
+        append = labels.append
+        for text, t1, t2, appdata in zip(texts, t1s, t2s, appdatas):
+            label = new(cls)
+            label._t1 = t1
+            label._t2 = t2
+            label.text = intern(text, text)
+            label.codec = codec
+            label.appdata = appdata
+            append(label)
+        return labels
 
     @property
     def t1(self):
@@ -669,8 +846,20 @@ a point in time, return the point."""
 
 
 class _LabelTier(MutableSet):
-    """A manager of (point) Label objects"""
-    
+    """A manager of (point) Label objects. A Label may be added to more than
+one tier; queries and output use its current times."""
+
+    __slots__ = (
+        'name', 'start', 'end', 'extra_data', '_list', '_time_buf',
+        '_t2_buf', '_synced_at'
+    )
+
+    # Number of times any tier has written new times to its Label objects.
+    # A Label may belong to more than one tier, so a tier whose _synced_at
+    # differs from this count reloads its time arrays from its labels before
+    # it uses them.
+    _time_writes = 0
+
     def __init__(self, start=0.0, end=float('inf'), name='', numlabels=None):
         super(_LabelTier, self).__init__()
         self.name = name
@@ -678,15 +867,22 @@ class _LabelTier(MutableSet):
         self.end = float(end)
         self.extra_data = {} # Container for additional file-specific data.
         self._list = []      # Container for Label objects.
-        # Array of starting (t1) timepoints used for calculations.
-        if numlabels == None:
-            self._time = np.array([])
-        else:    # Preallocate array.
-            self._time = np.empty(int(numlabels))
-            self._time[:] = np.nan
+        # Array of starting (t1) timepoints used for calculations, kept in
+        # the same order as _list. The numlabels parameter is accepted for
+        # backward compatibility; the array grows in place as labels are added.
+        self._time_buf = array('d')
+        # Parallel array of end (t2) timepoints; NaN for point labels.
+        self._t2_buf = array('d')
+        self._synced_at = _LabelTier._time_writes
 
     def __repr__(self):
-        s = "[" + ",".join(repr(l) for l in self._list) + "]"
+        # Abbreviate long tiers in the same way as _repr_html_().
+        if len(self._list) > 10:
+            s = "[" + ",".join(repr(l) for l in self._list[:5])
+            s += ",...,"
+            s += ",".join(repr(l) for l in self._list[-5:]) + "]"
+        else:
+            s = "[" + ",".join(repr(l) for l in self._list) + "]"
         return s
 
     def _repr_html_(self):
@@ -705,26 +901,49 @@ class _LabelTier(MutableSet):
 #### Methods required by abstract base class ####
 
     def __contains__(self, x):
-        return self._list.__contains__(x)
+        try:
+            self._index(x)
+        except ValueError:
+            return False
+        return True
     
     def __iter__(self):
         return iter(self._list)
     
     def add(self, label):
         """Add an annotation object."""
-        idx = np.searchsorted(self._time, label.t1)
+        self._refresh_times()
+        idx = bisect.bisect_left(self._time_buf, label.t1)
         self._list.insert(idx, label)
-        if len(self._time) > idx and np.isnan(self._time[idx]):
-            self._time[idx] = label.t1
-        else:
-            self._time = np.hstack([self._time[:idx], label.t1, self._time[idx:]])
+        self._time_buf.insert(idx, label.t1)
+        self._t2_buf.insert(idx, np.nan if label.t2 is None else label.t2)
             
+    def _extend(self, labels):
+        """Add a sequence of Label objects in bulk. If the labels are in
+increasing t1 order and follow the existing labels, their times are appended to
+the time arrays in a single operation. Otherwise they are added one at a time."""
+        labels = list(labels)
+        if len(labels) == 0:
+            return
+        self._refresh_times()
+        t1s = array('d', [lab.t1 for lab in labels])
+        if (len(self._time_buf) > 0 and self._time_buf[-1] >= t1s[0]) or \
+           not np.all(np.diff(np.frombuffer(t1s)) > 0):
+            for lab in labels:
+                self.add(lab)
+            return
+        self._list.extend(labels)
+        self._time_buf.extend(t1s)
+        self._t2_buf.extend(
+            [np.nan if lab.t2 is None else lab.t2 for lab in labels]
+        )
+
     def discard(self, label):
         """Remove a Label object."""
-        
-        idx = self._list.index(label)
-        self._list.remove(label)
-        self._time = np.hstack([self._time[:idx], self._time[idx+1:]])
+        idx = self._index(label)
+        del self._list[idx]
+        del self._time_buf[idx]
+        del self._t2_buf[idx]
     
     def __len__(self):
        return len(self._list)
@@ -742,9 +961,69 @@ from an iterable."""
         '''Allow indexing of tier like a list.'''
         return self._list[key]
 
+    def _t1_array(self):
+        """Return the label t1 times as a NumPy array. The array is a view
+that shares memory with the tier and must not be kept after labels are
+added or removed."""
+        return np.frombuffer(self._time_buf, dtype=np.float64)
+
+    def _t2_array(self):
+        """Return the label t2 times as a NumPy array, with NaN for point
+labels. Like _t1_array(), the array is a view that must not be kept."""
+        return np.frombuffer(self._t2_buf, dtype=np.float64)
+
+    def _label_times(self):
+        """Return the t1 and t2 times of the tier's Label objects as NumPy
+arrays, with NaN for point labels. The writers read the times from the labels
+rather than from the time arrays, so that a label shared with another tier is
+written with its current times."""
+        t1 = np.array([lab.t1 for lab in self._list], dtype=np.float64)
+        t2 = np.array([lab.t2 for lab in self._list], dtype=np.float64)
+        return (t1, t2)
+
+    def _index(self, label):
+        """Return the index of label in the tier, or raise ValueError if it
+is not found. The search is narrowed to labels with the same t1 by binary
+search before falling back to a full scan of the tier."""
+        self._refresh_times()
+        try:
+            lo = bisect.bisect_left(self._time_buf, label.t1)
+            hi = bisect.bisect_right(self._time_buf, label.t1)
+        except (AttributeError, TypeError):
+            return self._list.index(label)
+        try:
+            return self._list.index(label, lo, hi)
+        except ValueError:
+            return self._list.index(label)
+
+    def _sync_label_times(self):
+        """Copy the tier's time arrays back to its Label objects."""
+        for label, t1, t2 in zip(self._list, self._time_buf, self._t2_buf):
+            label._t1 = t1
+            if label._t2 is not None:
+                label._t2 = t2
+        _LabelTier._time_writes += 1
+        self._synced_at = _LabelTier._time_writes
+
+    def _refresh_times(self):
+        """Reload the time arrays from the tier's Label objects if another
+tier has changed label times since they were last loaded."""
+        if self._synced_at == _LabelTier._time_writes:
+            return
+        t1, t2 = self._label_times()
+        if np.any(np.diff(t1) < 0):
+            # Keep the tier ordered by t1, as scale_by() does.
+            order = np.argsort(t1, kind='stable')
+            self._list[:] = [self._list[idx] for idx in order.tolist()]
+            t1 = t1[order]
+            t2 = t2[order]
+        self._time_buf = array('d', t1.tobytes())
+        self._t2_buf = array('d', t2.tobytes())
+        self._synced_at = _LabelTier._time_writes
+
     def prev(self, label, skip=0):
         """Return the label preceding label. Use the skip parameter to return an earlier label, e.g. skip=1 returns the second preceding label."""
-        idx = self._list.index(label) - skip - 1
+        idx = self._index(label) - skip - 1
         try:
             label = self._list[idx]
         except IndexError:
@@ -753,7 +1032,7 @@ from an iterable."""
           
     def next(self, label, skip=0):
         """Return the label following label. Use the skip parameter to return a later label, e.g. skip=1 returns the second label after label."""
-        idx = self._list.index(label) + skip + 1
+        idx = self._index(label) + skip + 1
         try:
             label = self._list[idx]
         except IndexError:
@@ -763,11 +1042,47 @@ from an iterable."""
     def label_at(self, time, method='closest'):
         """Return the label occurring at a particular time."""
         label = None
-        if method == 'closest':
-            idx = abs(self._time - time).argmin()
+        if method == 'closest' and len(self._list) > 0:
+            self._refresh_times()
+            # Binary search for the labels on either side of time and choose
+            # the closer one, or the earlier one if they are equally close.
+            buf = self._time_buf
+            idx = bisect.bisect_left(buf, time)
+            if idx == len(buf) or \
+               (idx > 0 and time - buf[idx-1] <= buf[idx] - time):
+                idx -= 1
+            # Use the first of any labels with identical times.
+            idx = bisect.bisect_left(buf, buf[idx])
             label = self._list[idx]
         return label
-        
+
+    def _indexes_at(self, times, method='closest'):
+        """Return an array with the index of the label occurring at each of
+times, or -1 where there is no label."""
+        times = np.asarray(times, dtype=np.float64)
+        n = len(self._list)
+        if method != 'closest' or n == 0:
+            return np.full(times.shape, -1, dtype=np.intp)
+        self._refresh_times()
+        t = self._t1_array()
+        right = np.clip(np.searchsorted(t, times), 0, n - 1)
+        left = np.clip(right - 1, 0, n - 1)
+        idx = np.where(
+            np.abs(times - t[left]) <= np.abs(t[right] - times), left, right
+        )
+        # Use the first of any labels with identical times, as label_at() does.
+        return np.searchsorted(t, t[idx])
+
+    def labels_at_times(self, times, method='closest'):
+        """Return a list of the labels occurring at each of the values in
+times. This gives the same result as calling label_at() for each time, but
+the lookups are done in a single vectorized pass. None is returned for a
+time where no label is found."""
+        return [
+            self._list[idx] if idx >= 0 else None
+                for idx in self._indexes_at(times, method).tolist()
+        ]
+
     def search(self, pattern, return_match=False, **kwargs):
         """Return the ordered list of Label objects that contain pattern. If
         the return_match is True, return an ordered list of tuples that
@@ -782,19 +1097,21 @@ from an iterable."""
             labels = self._list
         else:
             labels = self.tslice(**kwargs)
+        # Look up the bound search method once rather than for every label.
+        search = pattern.search
         if return_match:
             return [(l,m) \
                     for l in labels \
                     # TODO: verify that *not* encoding is the correct thing to do
 #                    for m in [pattern.search(l.text.encode(l.codec))] \
-                    for m in [pattern.search(l.text)] \
+                    for m in [search(l.text)] \
                     if m]
         else:
             return [l \
                     for l in labels \
                     # TODO: verify that *not* encoding is the correct thing to do
 #                    if pattern.search(l.text.encode(l.codec))]
-                    if pattern.search(l.text)]
+                    if search(l.text)]
         
 
     def tslice(self, t1, t2=None, tol=0.0, ltol=0.0, rtol=0.0, lincl=True, \
@@ -811,14 +1128,18 @@ from an iterable."""
             right = t1 + tol + rtol
         else:
             right = t2 + tol + rtol
-        if lincl and rincl:
-            sl = [l for l in self._list if (l.t1 >= left and l.t1 <= right) ]
-        elif lincl:
-            sl = [l for l in self._list if (l.t1 >= left and l.t1 < right) ]
-        elif rincl:
-            sl = [l for l in self._list if (l.t1 > left and l.t1 <= right) ]
+        # Labels are ordered by t1, so the slice bounds are found by binary
+        # search.
+        self._refresh_times()
+        if lincl:
+            lo = bisect.bisect_left(self._time_buf, left)
+        else:
+            lo = bisect.bisect_right(self._time_buf, left)
+        if rincl:
+            hi = bisect.bisect_right(self._time_buf, right)
         else:
-            sl = [l for l in self._list if (l.t1 > left and l.t1 < right) ]
+            hi = bisect.bisect_left(self._time_buf, right)
+        sl = self._list[lo:hi]
         if t2 == None:
             if len(sl) > 1:
                 raise IndexError(
@@ -830,15 +1151,34 @@ from an iterable."""
 
     def scale_by(self, factor):
         """Multiply all annotation times by a factor."""
-        for item in self:
-            item._scale_by(factor)
-        self._time *= factor
+        # Convert before taking the buffer views, so that a bad argument
+        # does not leave the buffers exported in the traceback.
+        factor = float(factor)
+        self._refresh_times()
+        t1 = self._t1_array()
+        t1 *= factor
+        t2 = self._t2_array()
+        t2 *= factor
+        if factor < 0:
+            # A negative factor reverses the order of the times. Re-sort the
+            # tier so that the binary searches on its times remain valid.
+            order = np.argsort(t1, kind='stable')
+            self._list[:] = [self._list[idx] for idx in order.tolist()]
+            t1[:] = t1[order]
+            t2[:] = t2[order]
+        self._sync_label_times()
 
     def shift_by(self, t):
         """Add a constant to all annotation times."""
-        for item in self:
-            item._shift_by(t)
-        self._time += t
+        # Convert before taking the buffer views, so that a bad argument
+        # does not leave the buffers exported in the traceback.
+        t = float(t)
+        self._refresh_times()
+        t1 = self._t1_array()
+        t1 += t
+        t2 = self._t2_array()
+        t2 += t
+        self._sync_label_times()
 
     # TODO: come up with a good name and calling convention, then make 
     # this a normal (non-hidden) method; change in subclasses too.
@@ -859,6 +1199,9 @@ Please use as_string() instead.
 
 class PointTier(_LabelTier):
     """A manager of (point) Label objects"""
+
+    __slots__ = ()
+
     def __init__(self, start=0.0, end=float('inf'), name='', numlabels=None, *args, **kwargs):
         super(PointTier, self).__init__(start, end, name, numlabels, *args, **kwargs)
 
@@ -882,6 +1225,7 @@ Please use as_string() instead.
 
     def as_string(self, fmt=None):
         """Return the tier as a string of type fmt."""
+        s = None
         if fmt == 'praat_long':
             labels = [
                 '        class = "TextTier"',
@@ -890,16 +1234,15 @@ Please use as_string() instead.
                 "        xmax = {:0.12f}".format(self.end),
                 "        points: size = {:d}".format(len(self))
             ]
-            for idx,lab in enumerate(self._list):
-                lab = '\n'.join((
-                    "        points [{:d}]:".format(idx+1),
-                    "            number = {:1.20f}".format(lab.t1),
-                    '            mark = "{:s}"'.format(
-                                     lab.text.replace('"', '""')
-                                 )
-                ))
-                labels.append(lab)
-            return '\n'.join(labels)
+            t1s = _format_praat_times(self._label_times()[0].tolist())
+            texts = [lab.text.replace('"', '""') for lab in self._list]
+            labels.extend(
+                f'        points [{idx}]:\n'
+                f'            number = {t1}\n'
+                f'            mark = "{text}"'
+                    for idx, (text, t1) in enumerate(zip(texts, t1s), 1)
+            )
+            s = '\n'.join(labels)
         elif fmt == 'praat_short':
             labels = [
                 '"TextTier"',
@@ -908,30 +1251,27 @@ Please use as_string() instead.
                 "{:0.12f}".format(self.end),
                 "{:d}".format(len(self))
             ]
-            for lab in self._list:
-                lab = '\n'.join((
-                    "{:1.20f}".format(lab.t1),
-                    '"{:s}"'.format(lab.text.replace('"', '""'))
-                ))
-                labels.append(lab)
-            return '\n'.join(labels)
+            t1s = _format_praat_times(self._label_times()[0].tolist())
+            texts = [lab.text.replace('"', '""') for lab in self._list]
+            labels.extend(
+                f'{t1}\n"{text}"'
+                    for text, t1 in zip(texts, t1s)
+            )
+            s = '\n'.join(labels)
         elif fmt == 'esps':
             # TODO: implement
             pass
         elif fmt == 'wavesurfer':
             pass
             # TODO: implement
+        return s
 
     def as_df(self):
         """Return the tier as a Pandas DataFrame."""
-        t1 = pd.Series(self._time)
-        text = pd.Series([None] * len(t1))
-
-        for idx, label in enumerate(self):
-            text[idx] = label.text
-
-        df = pd.concat([t1, text], axis=1)
-        df.columns = ['t1', 'text']
+        df = pd.DataFrame({
+            't1': self._label_times()[0],
+            'text': pd.Series([lab.text for lab in self._list], dtype=object)
+        })
         return df
 
     def add(self, label):
@@ -939,11 +1279,24 @@ Please use as_string() instead.
         super(PointTier, self).add(label)
         if self.end == np.inf or label.t1 > self.end:
             self.end = label.t1
+
+    def _extend(self, labels):
+        """Add a sequence of Label objects in bulk."""
+        labels = list(labels)
+        super(PointTier, self)._extend(labels)
+        if len(labels) > 0:
+            # Same result as add() for each label, with one comparison.
+            maxtime = max([label.t1 for label in labels])
+            if self.end == np.inf or maxtime > self.end:
+                self.end = maxtime
             
     # TODO: add discard() and adjust self.end?
     
 class IntervalTier(_LabelTier):
     """A manager of interval Label objects"""
+
+    __slots__ = ()
+
     def __init__(self, start=0.0, end=float('inf'), name='', numlabels=None, *args, **kwargs):
         super(IntervalTier, self).__init__(start, end, name, numlabels, *args, **kwargs)
     # Get/set start time of list of point annotations.
@@ -968,6 +1321,7 @@ Please use as_string() instead.
 
     def as_string(self, fmt=None):
         """Return the tier as a string of type fmt."""
+        s = None
         if fmt == 'praat_long':
             labels = [
                 '        class = "IntervalTier"',
@@ -976,17 +1330,19 @@ Please use as_string() instead.
                 "        xmax = {:0.12f}".format(self.end),
                 "        intervals: size = {:d}".format(len(self))
             ]
-            for idx,lab in enumerate(self._list):
-                lab = '\n'.join((
-                    "        intervals [{:d}]:".format(idx+1),
-                    "            xmin = {:1.20f}".format(lab.t1),
-                    "            xmax = {:1.20f}".format(lab.t2),
-                    '            text = "{:s}"'.format(
-                                     lab.text.replace('"', '""')
-                                 )
-                ))
-                labels.append(lab)
-            return '\n'.join(labels)
+            t1s, t2s = self._label_times()
+            t1s = _format_praat_times(t1s.tolist())
+            t2s = _format_praat_times(t2s.tolist())
+            texts = [lab.text.replace('"', '""') for lab in self._list]
+            labels.extend(
+                f'        intervals [{idx}]:\n'
+                f'            xmin = {t1}\n'
+                f'            xmax = {t2}\n'
+                f'            text = "{text}"'
+                    for idx, (text, t1, t2)
+                        in enumerate(zip(texts, t1s, t2s), 1)
+            )
+            s = '\n'.join(labels)
         elif fmt == 'praat_short':
             labels = [
                 '"IntervalTier"',
@@ -995,20 +1351,22 @@ Please use as_string() instead.
                 "{:0.12f}".format(self.end),
                 "{:d}".format(len(self))
             ]
-            for lab in self._list:
-                lab = '\n'.join((
-                    "{:1.20f}".format(lab.t1),
-                    "{:1.20f}".format(lab.t2),
-                    '"{:s}"'.format(lab.text.replace('"', '""'))
-                ))
-                labels.append(lab)
-            return '\n'.join(labels)
+            t1s, t2s = self._label_times()
+            t1s = _format_praat_times(t1s.tolist())
+            t2s = _format_praat_times(t2s.tolist())
+            texts = [lab.text.replace('"', '""') for lab in self._list]
+            labels.extend(
+                f'{t1}\n{t2}\n"{text}"'
+                    for text, t1, t2 in zip(texts, t1s, t2s)
+            )
+            s = '\n'.join(labels)
         elif fmt == 'esps':
             # TODO: implement
             pass
         elif fmt == 'wavesurfer':
             pass
             # TODO: implement
+        return s
 
     def as_df(self, includes=['duration', 'center']):
         """Return the tier as a Pandas DataFrame.
@@ -1018,31 +1376,17 @@ columns to be included as a convenience. By default these columns are
 in these columns can be calculated from t1 and t2 you can reduce the
 memory usage of the DataFrame by excluding one or both of these strings
 from the includes list."""
-        t1 = pd.Series(self._time)
-        t2 = pd.Series([np.nan] * len(t1))
-        text = pd.Series([None] * len(t1))
+        t1, t2 = self._label_times()
+        df = pd.DataFrame({
+            't1': t1,
+            't2': t2,
+            'text': pd.Series([lab.text for lab in self._list], dtype=object)
+        })
         if 'duration' in includes:
-            dur = pd.Series([None] * len(t1), dtype=np.float64)
+            df['duration'] = t2 - t1
         if 'center' in includes:
-            ctr = pd.Series([None] * len(t1), dtype=np.float64)
-
-        for idx, label in enumerate(self):
-            t2[idx] = label.t2
-            text[idx] = label.text
-            if 'duration' in includes:
-                dur[idx] = label.duration
-            if 'center' in includes:
-                ctr[idx] = label.center
-
-        cols = ['t1', 't2', 'text']
-        df = pd.concat([t1, t2, text], axis=1)
-        if 'duration' in includes:
-            cols.extend(['duration'])
-            df = pd.concat([df, dur], axis=1)
-        if 'center' in includes:
-            cols.extend(['center'])
-            df = pd.concat([df, ctr], axis=1)
-        df.columns = cols
+            # Point labels (NaN t2) are centered on t1, as in Label.center.
+            df['center'] = np.where(np.isnan(t2), t1, (t1 + t2) / 2.0)
         return df
 
     def add(self, label):
@@ -1050,6 +1394,16 @@ from the includes list."""
         super(IntervalTier, self).add(label)
         if self.end == np.inf or label.t2 > self.end:
             self.end = label.t2
+
+    def _extend(self, labels):
+        """Add a sequence of Label objects in bulk."""
+        labels = list(labels)
+        super(IntervalTier, self)._extend(labels)
+        if len(labels) > 0:
+            # Same result as add() for each label, with one comparison.
+            maxtime = max([label.t2 for label in labels])
+            if self.end == np.inf or maxtime > self.end:
+                self.end = maxtime
             
     # TODO: add discard() and adjust self.end?
     
@@ -1069,14 +1423,19 @@ from the includes list."""
             right = t1 + tol + rtol
         else:
             right = t2 + tol + rtol
-        if lincl and rincl:
-            sl = [l for l in self._list if (l.t2 >= left and l.t1 <= right) ]
-        elif lincl:
-            sl = [l for l in self._list if (l.t2 >= left and l.t1 < right) ]
-        elif rincl:
-            sl = [l for l in self._list if (l.t2 > left and l.t1 <= right) ]
+        # Labels are ordered by t1, so the right bound is found by binary
+        # search. The t2 values are not necessarily ordered and are compared
+        # in a single vectorized pass over the remaining labels.
+        self._refresh_times()
+        if rincl:
+            hi = bisect.bisect_right(self._time_buf, right)
+        else:
+            hi = bisect.bisect_left(self._time_buf, right)
+        if lincl:
+            idxs = np.flatnonzero(self._t2_array()[:hi] >= left)
         else:
-            sl = [l for l in self._list if (l.t2 > left and l.t1 < right) ]
+            idxs = np.flatnonzero(self._t2_array()[:hi] > left)
+        sl = [self._list[idx] for idx in idxs.tolist()]
         if lstrip is True and sl[0].t1 < left:
             sl = sl[1:]
         if rstrip is True and sl[-1].t2 > right:
@@ -1094,15 +1453,29 @@ from the includes list."""
         """Return the label occurring at a particular time."""
         label = None
         if method == 'closest':
-            # FIXME: this implementation will fail for some cases
-            indexes = np.where(time >= self._time)
-            idx = indexes[0][-1]
-            label = self._list[idx]
+            self._refresh_times()
+            # Binary search for the last label that starts at or before time.
+            idx = bisect.bisect_right(self._time_buf, time) - 1
+            if idx >= 0:
+                label = self._list[idx]
         return label
 
+    def _indexes_at(self, times, method='closest'):
+        """Return an array with the index of the label occurring at each of
+times, or -1 where there is no label."""
+        times = np.asarray(times, dtype=np.float64)
+        n = len(self._list)
+        if method != 'closest' or n == 0:
+            return np.full(times.shape, -1, dtype=np.intp)
+        self._refresh_times()
+        # Index of the last label that starts at or before each time.
+        return np.searchsorted(self._t1_array(), times, side='right') - 1
+
 class LabelManager(MutableSet):
     """Manage one or more Tier objects."""
 
+    __slots__ = ('_tiers', 'codec', 'appdata')
+
     def __init__(self, from_file=None, from_type=None, 
                  codec=None, names=None, scale_by=None, shift_by=None,
                  appdata=None, *args, **kwargs):
@@ -1183,31 +1556,20 @@ Please use as_string() instead.
         """Return the tiers as a string of type fmt."""
         if fmt == 'praat_long':
             tiers = [
-                'File type = "ooTextFile"',
-                'Object class = "TextGrid"',
-                "",
-                'xmin = {:0.20f}'.format(self._start()),
-                'xmax = {:0.20f}'.format(self._end()),
-                'tiers? <exists>',
-                'size = {:d}'.format(len(self._tiers)),
-                'item []:'
+                f'File type = "ooTextFile"\nObject class = "TextGrid"\n\n'
+                f'xmin = {self._start():0.20f}\nxmax = {self._end():0.20f}\n'
+                f'tiers? <exists>\nsize = {len(self._tiers):d}\nitem []:'
             ]
             for idx,tier in enumerate(self._tiers):
-                tier = '\n'.join((
-                    "    item [{:d}]:".format(idx+1),
-                    tier.as_string('praat_long')
-                ))
-                tiers.append(tier)
+                tiers.append(
+                    f"    item [{idx+1:d}]:\n{tier.as_string('praat_long')}"
+                )
             return '\n'.join(tiers)
         elif fmt == 'praat_short':
             tiers = [
-                'File type = "ooTextFile"',
-                'Object class = "TextGrid"',
-                "",
-                '{:0.20f}'.format(self._start()),
-                '{:0.20f}'.format(self._end()),
-                '<exists>',
-                '{:d}'.format(len(self._tiers))
+                f'File type = "ooTextFile"\nObject class = "TextGrid"\n\n'
+                f'{self._start():0.20f}\n{self._end():0.20f}\n'
+                f'<exists>\n{len(self._tiers):d}'
             ]
             for tier in self._tiers:
                 tiers.append(tier.as_string('praat_short'))
@@ -1282,61 +1644,75 @@ or the tier name."""
 #    left: associate interval label text with preceding label and point label t1 and t2
 #    right: associate interval label text using point label and following label as t1 and t2
         tier = None
-        try:    # Try as an integer index first.
-            tier = self._tiers[id]
-        except TypeError:  # Must be a name.
+        # Names are looked up directly, without first raising and catching a
+        # TypeError from indexing with a string.
+        if not isinstance(id, str):
+            try:    # Try as an integer index first.
+                tier = self._tiers[id]
+            except TypeError:  # Must be a name.
+                pass
+        if tier is None:
             for t in self._tiers:
                 if t.name == id:
                     tier = t
                     break
-        if tier == None:
+        if tier is None:
             raise IndexError("Could not find a tier with given id.")
         if cast_to == "PointTier" and not isinstance(tier, PointTier):
             pttier = PointTier(start=tier.start, end=tier.end, name=tier.name)
+            ptlabs = []
             for lab in tier:
-                ptlab = copy.deepcopy(lab)
+                ptlab = lab.copy()
                 if shift_labels == 'left':
 # FIXME: don't use private attribute
                     ptlab._t1 = ptlab.t2
 # FIXME: don't use private attribute
                 ptlab._t2 = None
-                pttier.add(ptlab)
+                ptlabs.append(ptlab)
+            pttier._extend(ptlabs)
             tier = pttier
         elif cast_to == "IntervalTier" and not isinstance(tier, IntervalTier):
             inttier = IntervalTier(start=tier.start, end=tier.end, name=tier.name)
+            intlabs = []
             for lab in tier:
-                intlab = copy.deepcopy(lab)
+                intlab = lab.copy()
                 if shift_labels == 'left':
 # FIXME: don't use private attribute
                     intlab._t2 = intlab.t1
                 else:
                     pass
-                inttier.add(intlab)
+                intlabs.append(intlab)
+            inttier._extend(intlabs)
             tier = inttier
         return tier
 
     def labels_at(self, time, method='closest'):
         """Return a tuple of Label objects corresponding to the tiers at time."""
         labels = tuple([tier.label_at(time,method) for tier in self._tiers])
-#        for tier in self._tiers:
-#            labels.append(tier.label_at(time, method))
         names = self.names
         # Check to make sure every tier name is valid (not empty, not
         # containing whitespace, not a duplicate). If one or more names is not
         # valid, return a regular tuple instead of a namedtuple.
         if '' not in names and None not in names:
             seen = []
-            for name in self.names:
-                if re.compile(r'\s').search(name) or name in seen:
-                    labels = tuple(labels)
+            for name in names:
+                if _RE_WS.search(name) or name in seen:
                     break
                 else:
                     seen.append(name)
-#            if not isinstance(labels, tuple):
-            Ret = namedtuple('Ret', ' '.join(names))
-            labels = Ret(*labels)
+            else:
+                Ret = _ret_namedtuple(names)
+                labels = Ret(*labels)
         return labels
             
+    def labels_at_times(self, times, method='closest'):
+        """Return a list with one element per tier. Each element is a list of
+the tier's Label objects occurring at each of the values in times. The
+labels are looked up with a single vectorized search per tier, which is much
+faster than calling labels_at() for each time. None is returned for a time
+where no label is found in a tier."""
+        return [tier.labels_at_times(times, method) for tier in self._tiers]
+
     def scale_by(self, factor):
         """Multiply all annotation times in all tiers by a factor."""
         for tier in self._tiers:
@@ -1350,41 +1726,39 @@ or the tier name."""
     def _get_open_args(self, filename):
         '''Get the right mode and encoding parameter values for open().
 
-This method uses duck typing to determine whether we are running under
-Python 3 (automatically decodes text files) or Python 2 (does not decode).
+Only read_table() still opens files with these arguments. It opens the file
+in text mode with the codec of the LabelManager and hands the handle to
+pandas.read_csv, which reads and decodes it in chunks. The Praat, ESPS and
+wavesurfer readers read the whole file as bytes and decode it in one pass.
 '''
-        openargs = None
-        try:
-            with open(filename, encoding=self.codec) as f:
-                openargs = {'mode': 'r', 'encoding': self.codec}
-        except TypeError:
-            openargs = {'mode': 'rb'}
-        return openargs
+        return {'mode': 'r', 'encoding': self.codec}
 
     def detect_praat_encoding(self, filename):
         '''Guess and return the encoding of a file from the BOM. Limited to 'utf_8',
 'utf_16_be', and 'utf_16_le'. Assume 'utf-8' if no BOM.'''
-        has_bom = True
         # We want to read in binary mode under Python 2 or 3.
         with open(filename, 'rb') as f:
-            firstline = f.readline()
-            if firstline.startswith(codecs.BOM_UTF16_LE):
-                detected_codec = 'utf_16_le'
-            elif firstline.startswith(codecs.BOM_UTF16_BE):
-                detected_codec = 'utf_16_be'
-            elif firstline.startswith(codecs.BOM_UTF8):
-                detected_codec = 'utf-8'
-            else:
-                detected_codec = 'utf-8'
-                has_bom = False
-        return (detected_codec, has_bom)
+            return self._detect_praat_bom(f.read(3))
+
+    def _detect_praat_bom(self, head):
+        '''Return (codec, has_bom) for the leading bytes of a Praat file.'''
+        if head.startswith(codecs.BOM_UTF16_LE):
+            return ('utf_16_le', True)
+        elif head.startswith(codecs.BOM_UTF16_BE):
+            return ('utf_16_be', True)
+        elif head.startswith(codecs.BOM_UTF8):
+            return ('utf-8', True)
+        else:
+            return ('utf-8', False)
 
     def set_praat_encoding(self, filename):
         '''Set codec attribute for a Praat textgrid based on special logic. First
 determine if the textgrid has a BOM. If BOM exists, use the codec that
 it indicates. If it does not exist, use the codec suggested by the user. If user
 does not suggest a codec, use utf-8 encoding as default.'''
-        detected_codec, has_bom = self.detect_praat_encoding(filename)
+        self._set_praat_codec(*self.detect_praat_encoding(filename))
+
+    def _set_praat_codec(self, detected_codec, has_bom):
         if has_bom is True:  # Trust BOM.
             if self.codec is not None and (self.codec != detected_codec):
                sys.stderr.write(
@@ -1395,169 +1769,149 @@ Found BOM for {:} encoding.\n'''.format(self.codec, detected_codec)
         elif self.codec is None:  # Default
             self.codec = detected_codec
 
+    def _read_praat_buffer(self, filename):
+        '''Read a Praat file once, set the codec from the BOM at the start of
+its raw contents, and return its decoded text.'''
+        raw = _read_raw(filename)
+        self._set_praat_codec(*self._detect_praat_bom(raw[:3]))
+        return _decode(raw, self.codec)
+
     def read_praat(self, filename):
         """Populate labels by reading in a Praat file. The short/long format will be
 guessed."""
-        self.set_praat_encoding(filename)
-        openargs = self._get_open_args(filename)
-        with open(filename, **openargs) as f:
-            f.readline()   # skip a line
-            f.readline()   # skip a line
-            f.readline()   # skip a line
-            xmin = f.readline()  # should be 'xmin = ' line
-            if openargs['mode'] == 'rb':
-                xmin = xmin.decode(self.codec)
-            if re.match(r'xmin = \d', xmin):
-                f.close()
-                self.read_praat_long(filename)
-            elif re.match(r'\d', xmin):
-                f.close()
-                self.read_praat_short(filename)
-            else:
-                raise LabelManagerParseError("File does not appear to be a Praat format.")
+        # Read and decode the file once and hand the text to the parser
+        # rather than reopening it in the format-specific reader.
+        buf = self._read_praat_buffer(filename)
+        pos = 0
+        for n in range(3):   # skip three lines
+            toss, pos = _next_line(buf, pos)
+        xmin, pos = _next_line(buf, pos)  # should be 'xmin = ' line
+        if xmin.startswith('xmin = ') and xmin[7:8].isdigit():
+            self._parse_praat_long(buf)
+        elif xmin[:1].isdigit():
+            self._parse_praat_short(buf)
+        else:
+            raise LabelManagerParseError("File does not appear to be a Praat format.")
         
     def read_praat_short(self, filename):
-        # Regex that indicates end of a label for lines that include opening
-        # double quote.
-        labendre = re.compile(
-            r'''
-                (?:^"|[^"])
-                (?:"")*      # Allow even number of preceding double quotes (Praat's way of including quotation marks in label content)
-                "            # Line terminates with double quote
-                \s*          # Ignore whitespace
-                $
-                |            # OR
-                ^\s*"\s*$    # Only double quote and optional whitespace
-            ''',
-            re.VERBOSE
-        )
-        # Regex that indicates end of a label for lines that do not include
-        # opening double quote, i.e. end of a multiline label text.
-        mlabendre = re.compile(
-            r'''
-                (?:^|[^"])
-                (?:"")*      # Allow even number of preceding double quotes (Praat's way of including quotation marks in label content)
-                "            # Line terminates with double quote
-                \s*          # Ignore whitespace
-                $
-                |            # OR
-                ^\s*"\s*$    # Only double quote and optional whitespace
-            ''',
-            re.VERBOSE
-        )
-        # Regex that matches a label line that is exactly quotation marks.
-        onlyquotere = re.compile('^(?:"")+$')
-        self.set_praat_encoding(filename)
-        openargs = self._get_open_args(filename)
-        with open(filename, **openargs) as f:
-            firstline = f.readline()
-
-            # Read in header lines.
-            # TODO: use header lines for error checking or processing hints? Current
-            # implementation ignores their content.
-            tg = f.readline()
-            blank = f.readline()
-            start = f.readline()
-            end = f.readline()
-            exists = f.readline()
-            numtiers = f.readline()
-
-            # Don't use 'for line in f' loop construct since we use multiple
-            # readline() calls in the loop.
-            tier = None
-            while True:
-                line = f.readline()
-                if openargs['mode'] == 'rb':
-                    line = line.decode(self.codec)
-                if line == '': break   # Reached EOF.
-                line = line.strip()
-
-
-                if line == '': continue # Empty line.
-                # Start a new tier.
-                if line == '"IntervalTier"' or line == '"TextTier"':
-                    if tier != None: self.add(tier)
-                    tname = re.sub('^"|"$', '', f.readline().strip())
-                    tstart = f.readline()
-                    tend = f.readline()
-                    numintvl = f.readline()
-                    if openargs['mode'] == 'rb':
-                        tstart = tstart.decode(self.codec)
-                        tend = tend.decode(self.codec)
-                        numintvl = numintvl.decode(self.codec)
-                    numintvl = int(numintvl.strip())
-                    if line == '"IntervalTier"':
-                        tier = IntervalTier(start=tstart, end=tend, \
-                                                 name=tname, numlabels=numintvl)
-                    else:
-                        tier = PointTier(start=tstart, end=tend, \
-                                              name=tname, numlabels=numintvl)
-                # Add a label to existing tier.
+        self._parse_praat_short(self._read_praat_buffer(filename))
+
+    def _parse_praat_short(self, buf):
+        # Parse the decoded file from the buffer with a position cursor
+        # rather than line by line from the file object.
+        # Skip header lines: file type, object class, blank line, start, end,
+        # tiers exist flag, and number of tiers.
+        # TODO: use header lines for error checking or processing hints? Current
+        # implementation ignores their content.
+        pos = 0
+        for n in range(7):
+            toss, pos = _next_line(buf, pos)
+
+        tier = None
+        # Times (as strings) and texts of the labels in the current tier,
+        # converted and added in bulk at the end of the tier.
+        t1s = []
+        t2s = []
+        texts = []
+        while True:
+            line, pos = _next_line(buf, pos)
+            if line == '': break   # Reached EOF.
+            line = line.strip()
+
+
+            if line == '': continue # Empty line.
+            # Start a new tier.
+            if line == '"IntervalTier"' or line == '"TextTier"':
+                if tier != None:
+                    self._add_praat_short_tier(tier, t1s, t2s, texts)
+                    t1s = []
+                    t2s = []
+                    texts = []
+                tname, pos = _next_line(buf, pos)
+                tname = _strip_praat_quotes(tname.strip())
+                tstart, pos = _next_line(buf, pos)
+                tend, pos = _next_line(buf, pos)
+                numintvl, pos = _next_line(buf, pos)
+                numintvl = int(numintvl.strip())
+                if line == '"IntervalTier"':
+                    tier = IntervalTier(start=tstart, end=tend, \
+                                             name=tname, numlabels=numintvl)
                 else:
-                    if isinstance(tier, IntervalTier):
-                        t2 = f.readline()
-                        if openargs['mode'] == 'rb':
-                            t2 = t2.decode(self.codec)
-                    else:
-
-                        t2 = None
-                    labtext = f.readline()
-                    if labendre.search(labtext.strip()) is None \
-                        and onlyquotere.match(labtext.strip()) is None:
-                        while True:
-                            addline = f.readline()
-                            labtext += addline
-                            if mlabendre.search(addline) is not None:
-                                break
-                            elif addline == '':
-                                msg = "Parse error. Unterminated label '" + labtext + "' in tier '" + tier.name + "'."
-                                raise Exception(msg)
-                    if openargs['mode'] == 'rb':
-                        labtext = labtext.decode(self.codec)
-                    lab = Label(
-                                text=_clean_praat_string(labtext),
-                                t1=line,
-                                t2=t2,
-                                codec=self.codec
-                               )
-                    tier.add(lab)
-            if tier != None: self.add(tier)
+                    tier = PointTier(start=tstart, end=tend, \
+                                          name=tname, numlabels=numintvl)
+            # Add a label to existing tier.
+            else:
+                if tier is None:
+                    raise LabelManagerParseError(
+                        "Found label line '{}' before any tier.".format(line)
+                    )
+                t1s.append(line)
+                if isinstance(tier, IntervalTier):
+                    t2, pos = _next_line(buf, pos)
+                    t2s.append(t2)
+                textstart = pos
+                labtext, pos = _next_line(buf, pos)
+                # A label line can only end the label if it ends with a
+                # double quote, which is cheaper to check than the regexes.
+                stripped = labtext.strip()
+                if not stripped.endswith('"') or \
+                    (_PRAAT_SHORT_LABEND_RE.search(stripped) is None \
+                    and _PRAAT_SHORT_ONLYQUOTE_RE.match(stripped) is None):
+                    # Multiline label. Find the last line and take the text
+                    # from the buffer as a single slice.
+                    while True:
+                        addline, pos = _next_line(buf, pos)
+                        if addline.rstrip().endswith('"') and \
+                            _PRAAT_SHORT_MLABEND_RE.search(addline) is not None:
+                            break
+                        elif addline == '':
+                            msg = "Parse error. Unterminated label '" + buf[textstart:pos] + "' in tier '" + tier.name + "'."
+                            raise Exception(msg)
+                    labtext = buf[textstart:pos]
+                texts.append(_clean_praat_string(labtext))
+        if tier != None:
+            self._add_praat_short_tier(tier, t1s, t2s, texts)
+
+    # Create the labels for a tier in a praat_short file from lists of their
+    # t1 and t2 time strings and texts, add them to the tier, and add the
+    # tier to the LabelManager. The times are converted to float in a single
+    # numpy pass. t2s is empty for point tiers.
+    def _add_praat_short_tier(self, tier, t1s, t2s, texts):
+        t1s = np.array(t1s, dtype=np.float64).tolist()
+        if isinstance(tier, IntervalTier):
+            t2s = np.array(t2s, dtype=np.float64).tolist()
+        else:
+            t2s = [None] * len(t1s)
+        tier._extend(Label._list_from_times(texts, t1s, t2s, codec=self.codec))
+        self.add(tier)
 
     # Read the metadata section at the top of a tier in a praat_long file
-    # referenced by f. Create a label tier from the metadata and return it.
-    # Return None if metadata could not be read.
-    def _read_praat_long_tier_metadata(self, f, mode=None):
+    # from the buffer buf, starting at position pos. Create a label tier from
+    # the metadata and return it along with the number of labels the tier
+    # declares and the buffer position following the metadata. Return None
+    # for the tier if metadata could not be read.
+    def _read_praat_long_tier_metadata(self, buf, pos):
         d = dict(cls=None, tname=None, tstart=None, tend=None, numintvl=None)
         try:
-            line = f.readline()
+            line, pos = _next_line(buf, pos)
             assert(line != '')
-            if mode == 'rb':
-                line = line.decode(self.codec)
-            m = re.compile("class = \"(.+)\"").search(line)
+            m = _PRAAT_CLASS_RE.search(line)
             d['cls'] = m.group(1)
-            line = f.readline()
+            line, pos = _next_line(buf, pos)
             assert(line != '')
-            if mode == 'rb':
-                line = line.decode(self.codec)
-            m = re.compile("name = \"(.*)\"").search(line)
+            m = _PRAAT_NAME_RE.search(line)
             d['tname'] = m.group(1)
-            line = f.readline()
+            line, pos = _next_line(buf, pos)
             assert(line != '')
-            if mode == 'rb':
-                line = line.decode(self.codec)
-            m = re.compile(r"xmin = (-?[\d.]+)").search(line)
+            m = _PRAAT_XMIN_RE.search(line)
             d['tstart'] = m.group(1)
-            line = f.readline()
+            line, pos = _next_line(buf, pos)
             assert(line != '')
-            if mode == 'rb':
-                line = line.decode(self.codec)
-            m = re.compile(r"xmax = (-?[\d.]+)").search(line)
+            m = _PRAAT_XMAX_RE.search(line)
             d['tend'] = m.group(1)
-            line = f.readline()
+            line, pos = _next_line(buf, pos)
             assert(line != '')
-            if mode == 'rb':
-                line = line.decode(self.codec)
-            m = re.compile(r"(?:intervals|points): size = (\d+)").search(line)
+            m = _PRAAT_SIZE_RE.search(line)
             d['numintvl'] = m.group(1)
         except AssertionError:
             pass
@@ -1569,122 +1923,99 @@ guessed."""
                                   name=d['tname'], numlabels=d['numintvl'])
         else:
             tier = None
-        return tier
+        numlabels = None if d['numintvl'] is None else int(d['numintvl'])
+        return (tier, numlabels, pos)
 
     def read_praat_long(self, filename):
-        self.set_praat_encoding(filename)
-        openargs = self._get_open_args(filename)
-        with open(filename, **openargs) as f:
-            firstline = f.readline()
-            # Regexes to match line containing t1, t2, label text, and label end.
-            # TODO: use named captures
-            t1_re = re.compile(r"(?:xmin|number) = ([^\s]+)")
-            t2_re = re.compile(r"xmax = ([^\s]+)")
-            text_re = re.compile(r"^\s*(?:text|mark) = (\".*)")
-            end_label_re = re.compile(r"^\s*(?:item|intervals|points)\s*\[\d+\]:?")
-            item_re = re.compile(r"^\s*item\s*\[\d+\]:?")
-                
-            # Discard header lines.
-            # TODO: use header lines for error checking or processing hints? Current
-            # implementation ignores their content.
-            while True:
-                line = f.readline()
-                if openargs['mode'] == 'rb':
-                    line = line.decode(self.codec)
-                if item_re.search(line): break
-                # FIXME: better error
-                if line == '': raise Exception("Could not read file.")
-            
-            tier = self._read_praat_long_tier_metadata(
-                f, mode=openargs['mode']
-            )
-            
-            # Don't use 'for line in f' loop construct since we use multiple
-            # readline() calls in the loop.
-            t1 = t2 = text = None
-            while tier is not None:
-                if len(tier._time) == 0:   # empty tier; go to next tier
-                    self.add(tier)
-                    f.readline() # skip "item [n]:' line 
-                    tier = self._read_praat_long_tier_metadata(
-                        f, mode=openargs['mode']
-                    )
-                    continue
-                toss = f.readline()  # skip "intervals|points [n]:" line
-                t1line = f.readline()
-                if openargs['mode'] == 'rb':
-                    t1line = t1line.decode(self.codec)
-                m = t1_re.search(t1line)
-                t1 = float(m.group(1))
-                if isinstance(tier, IntervalTier):
-                    t2line = f.readline()
-                    if openargs['mode'] == 'rb':
-                        t2line = t2line.decode(self.codec)
-                    m = t2_re.search(t2line)
-                    t2 = float(m.group(1))
-                else:
-                    t2 = None
-                txtline = f.readline()
-                if openargs['mode'] == 'rb':
-                    txtline = txtline.decode(self.codec)
-                m = text_re.search(txtline)
-                text = m.group(1)
-                grabbing_text = True
-                while grabbing_text:
-                    loc = f.tell()
-                    line = f.readline()
-                    if openargs['mode'] == 'rb':
-                        line = line.decode(self.codec)
-                    if not (end_label_re.search(line) or line == ''):
-                        text += line
-                    else:
-                        grabbing_text = False
-                        lab = Label(
-                            text=_clean_praat_string(text),
-                            t1=t1,
-                            t2=t2,
-                            codec=self.codec
-                        )
-                        tier.add(lab)
-                        if item_re.search(line):  # Start new tier.
-                            self.add(tier)
-                            tier = self._read_praat_long_tier_metadata(
-                                f, mode=openargs['mode']
-                            )
-                        elif line == '': # Reached EOF
-                            self.add(tier)
-                            tier = None
-                        else:      # Found a new label line (intervals|points).
-                            #f.seek(-len(line),1)  # Rewind to intervals|points.
-                            f.seek(loc)
+        self._parse_praat_long(self._read_praat_buffer(filename))
+
+    def _parse_praat_long(self, buf):
+        # Parse the decoded file from the buffer with a position cursor
+        # rather than line by line from the file object.
+        # Discard header lines.
+        # TODO: use header lines for error checking or processing hints? Current
+        # implementation ignores their content.
+        pos = 0
+        while True:
+            line, pos = _next_line(buf, pos)
+            if _PRAAT_ITEM_RE.search(line): break
+            # FIXME: better error
+            if line == '': raise Exception("Could not read file.")
+
+        tier, numlabels, pos = self._read_praat_long_tier_metadata(buf, pos)
+
+        # Label fields for the current tier, added in bulk at the end.
+        texts = []
+        t1s = []
+        t2s = []
+        while tier is not None:
+            if not numlabels:   # empty tier; go to next tier
+                self.add(tier)
+                line, pos = _next_line(buf, pos) # skip "item [n]:' line
+                tier, numlabels, pos = \
+                    self._read_praat_long_tier_metadata(buf, pos)
+                continue
+            # Match the interval/point line, times, and start of the text of
+            # the label in a single regex call.
+            if isinstance(tier, IntervalTier):
+                m = _PRAAT_INTERVAL_RE.match(buf, pos)
+            else:
+                m = _PRAAT_POINT_RE.match(buf, pos)
+            if m is None:
+                raise LabelManagerParseError(
+                    "Could not parse label in tier '{}'.".format(tier.name)
+                )
+            t1 = float(m.group(1))
+            t2 = float(m.group(2)) if m.lastindex == 2 else None
+            textstart = m.end() - 1   # Include the opening double quote.
+            # The label text, which may span multiple lines, continues up to
+            # the next label or tier, or to EOF.
+            m = _PRAAT_END_LABEL_RE.search(buf, m.end())
+            textend = len(buf) if m is None else m.start()
+            texts.append(_clean_praat_string(buf[textstart:textend]))
+            t1s.append(t1)
+            t2s.append(t2)
+            if m is None or m.group(1) == 'item':
+                tier._extend(
+                    Label._list_from_times(texts, t1s, t2s, codec=self.codec)
+                )
+                texts = []
+                t1s = []
+                t2s = []
+                self.add(tier)
+            if m is None:                  # Reached EOF
+                tier = None
+            elif m.group(1) == 'item':     # Start new tier.
+                line, pos = _next_line(buf, textend)
+                tier, numlabels, pos = \
+                    self._read_praat_long_tier_metadata(buf, pos)
+            else:      # Found a new label line (intervals|points).
+                pos = textend
 
     def _start(self):
         """Get the start time of the tiers in the LabelManager."""
-        return min([t.start for t in self._tiers])
+        return min(t.start for t in self._tiers)
         
     def _end(self):
         """Get the end time of the tiers in the LabelManager."""
-        return max([t.end for t in self._tiers])
+        return max(t.end for t in self._tiers)
         
         
     def _get_praat_header(self, type=None):
         """Get the header (pre-tier) section of a Praat label file."""
-        xmin = "{:1.16f}".format(self._start())
-        xmax = "{:1.16f}".format(self._end())
-        intervals = "{:d}".format(len(self._tiers))
+        xmin = self._start()
+        xmax = self._end()
+        ntiers = len(self._tiers)
         if type == 'long':
-            xmin = "xmin = " + xmin
-            xmax = "xmax = " + xmax
-            intervals = "intervals: size = " + intervals
-        return "\n".join((
-            'File type = "ooTextFile"',
-            'Object class = "TextGrid"',
-            '',
-            xmin,
-            xmax,
-            '<exists>',
-            intervals
-            ))
+            return (
+                f'File type = "ooTextFile"\nObject class = "TextGrid"\n\n'
+                f'xmin = {xmin:1.16f}\nxmax = {xmax:1.16f}\n<exists>\n'
+                f'intervals: size = {ntiers:d}'
+            )
+        return (
+            f'File type = "ooTextFile"\nObject class = "TextGrid"\n\n'
+            f'{xmin:1.16f}\n{xmax:1.16f}\n<exists>\n{ntiers:d}'
+        )
 
     # TODO: this works for karuk .eaf files; need to find out whether this is sufficient for all
     # .eaf files
@@ -1729,15 +2060,39 @@ guessed."""
             tier.extra_data['eaf'] = eaftier.attrib
             self.add(tier)
 
+        # Index the tiers and annotations by id in a single pass over the
+        # document rather than searching the whole tree with XPath for every
+        # reference annotation. Where ids repeat, the first element in
+        # document order is used, as find() would.
+        eaftiers = {}       # TIER_ID -> TIER element
+        ref_counts = {}     # (TIER_ID, ANNOTATION_REF) -> number of refs
+        ref_parents = {}    # REF_ANNOTATION id -> its ANNOTATION_REF
+        alignables = {}     # ALIGNABLE_ANNOTATION id -> element
+        for eaftier in root.iter('TIER'):
+            tier_id = eaftier.get('TIER_ID')
+            eaftiers.setdefault(tier_id, eaftier)
+            for anno in eaftier.findall('ANNOTATION/REF_ANNOTATION'):
+                key = (tier_id, anno.get('ANNOTATION_REF'))
+                ref_counts[key] = ref_counts.get(key, 0) + 1
+        for annotation in root.iter('ANNOTATION'):
+            for anno in annotation:
+                if anno.tag == 'REF_ANNOTATION':
+                    ref_parents.setdefault(
+                        anno.get('ANNOTATION_ID'), anno.get('ANNOTATION_REF')
+                    )
+                elif anno.tag == 'ALIGNABLE_ANNOTATION':
+                    alignables.setdefault(anno.get('ANNOTATION_ID'), anno)
+
         # Process labels on parent tiers before dependent tiers so that
         # timeslots are filled in properly in the dependents.
         for name in tiersort:
             tier = self.tier(name)
+            labs = []   # Labels for the tier, added in bulk at the end.
             anno_run = []
             anno_run_length = None
             start_t = None
             end_t = None
-            eaftier = root.find(".//TIER/[@TIER_ID='{}']".format(name))
+            eaftier = eaftiers[name]
             for anno in eaftier.findall('ANNOTATION/*'):
                 anno_id = anno.get('ANNOTATION_ID')
                 if anno.tag == 'ALIGNABLE_ANNOTATION':
@@ -1749,18 +2104,15 @@ guessed."""
                     t_anno = None
                     ref = anno.get('ANNOTATION_REF')
                     if anno_run_length is None:
-                        xpath = ".//TIER/[@TIER_ID='{}']/ANNOTATION/REF_ANNOTATION/[@ANNOTATION_REF='{}']".format(name,ref)
-                        anno_run_length = len(root.findall(xpath))
+                        anno_run_length = ref_counts[(name, ref)]
                     start_t = float(tslot_tiers['t1'][ref])
                     end_t = float(tslot_tiers['t2'][ref])
                     # Tiers can be hierarchical. Loop through refs until we find the top.
                     while t_anno is None:
-                        xpath = ".//ANNOTATION/REF_ANNOTATION/[@ANNOTATION_ID='{}']".format(ref)
                         try:
-                            ref = root.find(xpath).get('ANNOTATION_REF')
-                        except AttributeError:  # No more REF_ANNOTATION. At the top.
-                            xpath = ".//ANNOTATION/ALIGNABLE_ANNOTATION/[@ANNOTATION_ID='{}']".format(ref)
-                            t_anno = root.find(xpath)
+                            ref = ref_parents[ref]
+                        except KeyError:  # No more REF_ANNOTATION. At the top.
+                            t_anno = alignables.get(ref)
                             if t_anno is None:
                                 raise RuntimeError("Could not find annotation ref.")
                 else:
@@ -1780,13 +2132,18 @@ guessed."""
                             t1 += round(idx * step)
                         if idx == (anno_run_length - 1):
                             t2 = end_t
-                        tier.add(Label(text=label, t1=t1, t2=t2, codec=codec))
+                        labs.append(
+                            Label._from_times(
+                                text=label, t1=t1, t2=t2, codec=codec
+                            )
+                        )
                         tslot_tiers['t1'][the_id] = t1
                         tslot_tiers['t2'][the_id] = t2
                     anno_run = []
                     start_t = None
                     end_t = None
                     anno_run_length = None
+            tier._extend(labs)
 
     def read_esps(self, filename, sep=None):
         """Read an ESPS label file."""
@@ -1809,60 +2166,70 @@ guessed."""
         # header field is not always well-maintained, so we simply create
         # tiers based on how many separators we find in the content.
 
-        # Precompile regular expressions to identify the 'separator' header
-        # line, end-of-header line, and empty/comment label lines.
-        separator = re.compile(r'separator\s+(.+)')
-        end_head = re.compile(r'^#')
-        empty_line = re.compile(r'^\s*(#.*)?$')
-        
-        openargs = self._get_open_args(filename)
-        with open(filename, **openargs) as f:
-            # Process the header
-            while True:
-                line = f.readline()
-                if not line:
-                    raise LabelManagerParseError("Did not find header separator '#'!")
-                    return None
-                m = separator.search(line)
-                if m: sep = m.group(1)
-                if end_head.search(line): break
-
-            # Process the body
-            old_t2 = 0.0
-            while True:
-                line = f.readline()
-                if not line: break
-                if empty_line.search(line): continue
-                try:
-                  (t2,color,content) = line.strip().split(None,2)
-                except ValueError:
-                    try:
-                        (t2,color) = line.strip().split(None,1)
-                        content = ''
-                    except ValueError:
-                        t2 = line.strip()
-                        color = ''
-                        content = ''
-
-                for idx, val in enumerate(content.split(sep)):
-                    try:
-                        tier = self.tier(idx)
-                    except IndexError:
-                        tier = IntervalTier()
-                        self.add(tier)
-                    tier.add(Label(text=val, t1=old_t2, t2=t2, appdata=color))
-                    old_t2 = t2
-                
- 
+        buf = _read_decoded(filename, self.codec)
+        # Process the header
+        pos = 0
+        while True:
+            line, pos = _next_line(buf, pos)
+            if not line:
+                raise LabelManagerParseError("Did not find header separator '#'!")
+                return None
+            m = _ESPS_SEPARATOR_RE.search(line)
+            if m: sep = m.group(1)
+            if _ESPS_END_HEAD_RE.search(line): break
+
+        # Match the time, color, and content fields of all rows of the body
+        # in one pass; the latter two may be missing.
+        rows = _ESPS_ROW_RE.findall(buf, pos)
+
+        # Convert the time column in one pass.
+        t2s = np.array([row[0] for row in rows], dtype=np.float64).tolist()
+        old_t2 = 0.0
+        # Label fields (texts, t1s, t2s, colors) for each tier, added in bulk
+        # at the end.
+        tiercols = []
+        for (toss, color, content), t2 in zip(rows, t2s):
+            for idx, val in enumerate(content.rstrip().split(sep)):
+                if idx == len(tiercols):
+                    tiercols.append(([], [], [], []))
+                texts, t1s, tier_t2s, colors = tiercols[idx]
+                texts.append(val)
+                t1s.append(old_t2)
+                tier_t2s.append(t2)
+                colors.append(color)
+                old_t2 = t2
+        for idx, (texts, t1s, tier_t2s, colors) in enumerate(tiercols):
+            try:
+                tier = self.tier(idx)
+            except IndexError:
+                tier = IntervalTier()
+                self.add(tier)
+            tier._extend(
+                Label._list_from_times(texts, t1s, tier_t2s, appdatas=colors)
+            )
+
     def read_wavesurfer(self, filename):
         """Read a wavesurfer label file."""
-        openargs = self._get_open_args(filename)
-        with open(filename, **openargs) as f:
-            tier = IntervalTier()
-            for line in f:
-                (t1,t2,text) = line.strip().split(None,2)
-                tier.add(Label(text=text, t1=t1, t2=t2))
-            self.add(tier)                
+        buf = _read_decoded(filename, self.codec)
+        rows = _WAVESURFER_ROW_RE.findall(buf)
+        # Every line must be a label row. If some did not match, report the
+        # first of them.
+        nlines = buf.count('\n') + (buf != '' and not buf.endswith('\n'))
+        if len(rows) != nlines:
+            for line in buf.split('\n'):
+                if _WAVESURFER_ROW_RE.match(line) is None:
+                    raise LabelManagerParseError(
+                        "Could not parse wavesurfer line '{}'.".format(line)
+                    )
+        # Convert the time columns in one pass; the label text may contain
+        # whitespace and is kept as the remainder of the line.
+        times = np.array([row[:2] for row in rows], dtype=np.float64)
+        times = times.reshape(-1, 2).T.tolist()
+        tier = IntervalTier()
+        tier._extend(
+            Label._list_from_times([row[2] for row in rows], times[0], times[1])
+        )
+        self.add(tier)
 
     def read_table(self, infile, sep='\t', fields_in_head=True,
                   t1_col='t1', t2_col='t2', fields=None, skiplines=0,
@@ -1876,26 +2243,24 @@ first value t1_start and adding t1_step for subsequent values."""
             t1_step = 1
         if self.codec is None:
             self.codec = 'utf-8'
+        # infile can be a filename or a text or binary file handle (as would
+        # be returned by subprocess.Popen(..., stdout=PIPE) with or without
+        # universal_newlines=True).
         try:
             openargs = self._get_open_args(infile)
             f = open(infile, **openargs)
-            binmode = openargs['mode'] == 'rb'
         except TypeError as e:  # infile should already be a file handle
             f = infile
-            try:
-                binmode = f.mode == 'rb'
-            except AttributeError:
-                # We get here if infile is a TextIOWrapper rather than a
-                # file handle (as would be returned by 
-                # subprocess.Popen(..., stdout=PIPE, universal_newlines=True)
-                binmode = False
 
         for skip in range(skiplines):
             f.readline()
 
         # Process field names.
         if fields_in_head:
-            fields = f.readline().rstrip().split(sep)
+            head = f.readline()
+            if isinstance(head, bytes):
+                head = head.decode(self.codec)
+            fields = head.rstrip().split(sep)
         else:
             try:
                 if isinstance(fields, (str, unicode)):
@@ -1921,27 +2286,51 @@ first value t1_start and adding t1_step for subsequent values."""
                 if fld == 't1': continue
                 tiers.append(PointTier(name=fld))
 
-        # Parse labels from rows.
-        t1 = t2 = tstart = tend = None
-        valsep = '\r\n'
-        if binmode is True:
-            sep = sep.encode(self.codec)
-            valsep = valsep.encode(self.codec)
-        for idx, line in enumerate([l for l in f.readlines() if l != '']):
-            vals = [val.strip() for val in line.rstrip(valsep).split(sep)]
-            if t1_start is not None and t1_step is not None:
-                t1 = (idx * t1_step) + t1_start
-                if t1idx is not None:
-                    vals.pop(t1idx)
-            else:
-                t1 = vals.pop(t1idx)
-                if binmode is True: t1 = t1.decode(self.codec)
-            if tstart == None: tstart = t1
-            if t2idx != None: t2 = vals.pop(t2idx)
-            if binmode is True and t2 is not None: t2 = t2.decode(self.codec)
-            for tier, val in zip(tiers, vals):
-                if binmode is True: val = val.decode(self.codec)
-                tier.add(Label(text=val, t1=t1, t2=t2))
+        # Parse labels from rows with pandas.read_csv, which reads the rest of
+        # the stream in chunks. All values are read as strings so that label
+        # text is kept exactly as written. The time columns are converted to
+        # floats in a single numpy pass. Rows with fewer fields than named in
+        # fields are padded with empty values, and extra fields are ignored.
+        ncols = len(fields)
+        if len(sep) == 1:
+            df = pd.read_csv(
+                f, sep=sep, header=None, names=range(ncols),
+                usecols=range(ncols), index_col=False, dtype=str,
+                na_filter=False, quoting=csv.QUOTE_NONE, encoding=self.codec
+            )
+            cols = [df[col].str.strip().tolist() for col in df.columns]
+        else:
+            # The C tokenizer only accepts single-character separators, so
+            # rows with longer ones are split line by line.
+            cols = [[] for fld in fields]
+            for line in f:
+                if isinstance(line, bytes):
+                    line = line.decode(self.codec)
+                if line.strip() == '':
+                    continue
+                vals = line.rstrip('\r\n').split(sep)
+                vals.extend([''] * (ncols - len(vals)))
+                for col, val in zip(cols, vals):
+                    col.append(val.strip())
+        nrows = len(cols[0]) if cols else 0
+        if t1_start is not None and t1_step is not None:
+            t1s = (
+                np.arange(nrows, dtype=np.float64) * t1_step + t1_start
+            ).tolist()
+        else:
+            t1s = np.array(cols[t1idx], dtype=np.float64).tolist()
+        if t2idx is None:
+            t2s = [None] * nrows
+        else:
+            t2s = np.array(cols[t2idx], dtype=np.float64).tolist()
+        valcols = [
+            col for idx, col in enumerate(cols) if idx not in (t1idx, t2idx)
+        ]
+        for tier, col in zip(tiers, valcols):
+            tier._extend(Label._list_from_times(col, t1s, t2s))
+        tstart = t1s[0] if t1s else None
+        t1 = t1s[-1] if t1s else None
+        t2 = t2s[-1] if t2s else None
 
         # Finish the tier.
         if t2 == None:
@@ -642,6 +642,379 @@ Object class = "TextGrid"
 "L"
 '''.strip())
 
+def test_labels_at():
+    '''Test labels_at() namedtuple and plain tuple return values.'''
+    lm = audiolabel.LabelManager(
+        from_file='test/this_is_a_label_file.long.TextGrid',
+        from_type='praat'
+    )
+    labels = lm.labels_at(0.5)
+    assert(labels.word.text == 'is')
+    assert(labels.phone.text == 'IH')
+    assert(lm.labels_at(0.5).__class__ is labels.__class__)
+    lm.names = ['two words']
+    labels = lm.labels_at(0.5)
+    assert(type(labels) == tuple)
+    assert(labels[0].text == 'is')
+
+def test_as_string_after_changes():
+    '''Test that as_string() output reflects changes to the tier.'''
+    lm = audiolabel.LabelManager(
+        from_file='test/quotes.TextGrid',
+        from_type='praat'
+    )
+    tier = lm.tier('point')
+    s1 = tier.as_string('praat_short')
+    assert(s1 == tier.as_string('praat_short'))
+    tier.add(audiolabel.Label('new', 0.75))
+    s2 = tier.as_string('praat_short')
+    assert(s2 != s1)
+    assert(s2.endswith('0.75000000000000000000\n"new"'))
+    tier.shift_by(1.0)
+    assert('1.75000000000000000000' in tier.as_string('praat_short'))
+    tier.name = 'renamed'
+    assert('"renamed"' in tier.as_string('praat_short'))
+    tier[0].text = 'CHANGED'
+    assert('"CHANGED"' in tier.as_string('praat_short'))
+    assert('"CHANGED"' in lm.as_string('praat_long'))
+
+def test_as_string_shared_label():
+    '''Test that output uses the current times of a label shared between
+tiers.'''
+    lab = audiolabel.Label('a', 1.0, 2.0)
+    tier1 = audiolabel.IntervalTier()
+    tier2 = audiolabel.IntervalTier()
+    tier1.add(lab)
+    tier2.add(lab)
+    tier1.shift_by(0.5)
+    assert(lab.t1 == 1.5)
+    assert('1.50000000000000000000\n2.50000000000000000000' in
+        tier2.as_string('praat_short'))
+    assert('xmin = 1.50000000000000000000' in tier2.as_string('praat_long'))
+    df = tier2.as_df()
+    assert(df['t1'][0] == 1.5)
+    assert(df['t2'][0] == 2.5)
+    assert(df['duration'][0] == 1.0)
+    pt = audiolabel.PointTier()
+    pt.add(lab)
+    tier1.scale_by(2.0)
+    assert('3.00000000000000000000\n"a"' in pt.as_string('praat_short'))
+    assert(pt.as_df()['t1'][0] == 3.0)
+
+def test_tier_cast():
+    '''Test casting tiers with the cast_to parameter of tier().'''
+    lm = audiolabel.LabelManager(
+        from_file='test/this_is_a_label_file.long.TextGrid',
+        from_type='praat'
+    )
+    word = lm.tier('word')
+    pt = lm.tier('word', cast_to='PointTier')
+    assert(isinstance(pt, audiolabel.PointTier))
+    assert(len(pt) == len(word))
+    assert(pt[1].t1 == word[1].t2)
+    assert(pt[1].t2 is None)
+    assert(pt[1].text == word[1].text)
+    assert(pt[1] is not word[1])
+    it = lm.tier('stimulus', cast_to='IntervalTier')
+    assert(isinstance(it, audiolabel.IntervalTier))
+    assert(it[0].t2 == lm.tier('stimulus')[0].t1)
+
+def test_tier_cast_label_subclass():
+    '''Test that casting a tier keeps Label subclasses and their slots.'''
+    class MyLabel(audiolabel.Label):
+        __slots__ = ('extra',)
+    lab = MyLabel('a', 1.0, 2.0, appdata={'k': [1]})
+    lab.extra = 'x'
+    tier = audiolabel.IntervalTier()
+    tier.add(lab)
+    lm = audiolabel.LabelManager()
+    lm.add(tier)
+    pt = lm.tier(0, cast_to='PointTier')
+    assert(type(pt[0]) is MyLabel)
+    assert(pt[0].extra == 'x')
+    assert(pt[0].t1 == 2.0 and pt[0].t2 is None)
+    assert(pt[0].appdata == lab.appdata)
+    assert(pt[0].appdata is not lab.appdata)
+    assert(lab.t2 == 2.0)
+
+def test_labels_at_times():
+    '''Test vectorized labels_at_times() against label_at().'''
+    lm = audiolabel.LabelManager(
+        from_file='test/this_is_a_label_file.long.TextGrid',
+        from_type='praat'
+    )
+    times = [0.0, 0.5, 0.61, 1.0, 1.7, 5.0]
+    tierlabels = lm.labels_at_times(times)
+    assert(len(tierlabels) == 3)
+    for tier, labels in zip(lm, tierlabels):
+        assert(len(labels) == len(times))
+        for t, label in zip(times, labels):
+            assert(label is tier.label_at(t))
+    assert(lm.tier('word').labels_at_times([-1.0])[0] is None)
+    assert(lm.tier('word').label_at(-1.0) is None)
+    assert(audiolabel.PointTier().label_at(1.0) is None)
+
+def test_labels_at_times_negative_scale():
+    '''Test labels_at_times() after scaling by a negative factor.'''
+    lm = audiolabel.LabelManager(
+        from_file='test/this_is_a_label_file.long.TextGrid',
+        from_type='praat'
+    )
+    lm.scale_by(-1)
+    times = [-5.0, -1.0, -0.61, -0.5, 0.0, 1.0]
+    for tier in lm:
+        t1s = [lab.t1 for lab in tier]
+        assert(t1s == sorted(t1s))
+        for t, label in zip(times, tier.labels_at_times(times)):
+            assert(label is tier.label_at(t))
+    tier = lm.tier('word')
+    tier.add(audiolabel.Label('new', -0.55, -0.5))
+    assert(tier.label_at(-0.55).text == 'new')
+
+def test_repr():
+    '''Test Label and tier repr().'''
+    l1 = audiolabel.Label('first', 1.0, 2.0)
+    assert(repr(l1) == "Label( t1=1.0000, t2=2.0000, text='first' )")
+    tier = audiolabel.IntervalTier()
+    for t1 in range(12):
+        tier.add(audiolabel.Label('label' + str(t1), float(t1), float(t1+1)))
+    s = repr(tier)
+    assert(s.count('Label(') == 10)
+    assert(',...,' in s)
+    assert("text='label11'" in s)
+
+def test_table_t1_t2():
+    with NamedTemporaryFile('w', suffix='.table', delete=False) as f:
+        f.write('t1\tt2\tword\n0.0\t0.5\tthe\n0.5\t1.25\tcat\n\n')
+    try:
+        lm = audiolabel.LabelManager(from_file=f.name, from_type='table')
+    finally:
+        os.remove(f.name)
+    tier = lm.tier('word')
+    assert isinstance(tier, audiolabel.IntervalTier)
+    assert [lab.text for lab in tier] == ['the', 'cat']
+    assert tier[1].t1 == 0.5
+    assert tier[1].t2 == 1.25
+    assert tier.start == 0.0
+    assert tier.end == 1.25
+
+def _read_table_str(content, **kwargs):
+    with NamedTemporaryFile('w', suffix='.table', delete=False) as f:
+        f.write(content)
+    try:
+        return audiolabel.LabelManager(
+            from_file=f.name, from_type='table', **kwargs
+        )
+    finally:
+        os.remove(f.name)
+
+def test_table_binary_handle():
+    '''Test reading a table with a header line from a binary file handle.'''
+    with open('test/sample.table', 'rb') as f:
+        lm = audiolabel.LabelManager(
+            from_file=f, from_type='table', t1_col='sec'
+        )
+    assert len(lm._tiers) == 6
+    assert lm.tier('rms')[0].text == '7.1'
+
+def test_table_header_only():
+    lm = _read_table_str('t1\tt2\tword\n')
+    assert lm.names == ('word',)
+    assert len(lm.tier('word')) == 0
+
+def test_table_multichar_sep():
+    lm = _read_table_str('t1::t2::word\n0.0::0.5::the\n0.5::1.0::c|t\n', sep='::')
+    tier = lm.tier('word')
+    assert [lab.text for lab in tier] == ['the', 'c|t']
+    assert tier[1].t2 == 1.0
+
+def test_table_extra_fields():
+    lm = _read_table_str(
+        't1\tt2\tword\n0.0\t0.5\tthe\n0.5\t1.0\tcat\textra\n'
+    )
+    tier = lm.tier('word')
+    assert [lab.text for lab in tier] == ['the', 'cat']
+    assert tier.end == 1.0
+
+def test_table_short_first_row():
+    for sep in ('\t', '::'):
+        lm = _read_table_str(
+            sep.join(['t1', 'w', 'v']) + '\n0' + sep + 'a\n' +
+            sep.join(['1', 'b', 'c']) + '\n',
+            sep=sep
+        )
+        assert [lab.text for lab in lm.tier('w')] == ['a', 'b']
+        assert [lab.text for lab in lm.tier('v')] == ['', 'c']
+        assert lm.tier('v')[1].t1 == 1.0
+
+def test_table_t1_step():
+    lm = _read_table_str('word\nthe\ncat\n', t1_col=None)
+    tier = lm.tier('word')
+    assert [lab.t1 for lab in tier] == [0.0, 1.0]
+    assert all(type(lab.t1) == float for lab in tier)
+
+def test_praat_short_wrong_format():
+    '''Test that a long TextGrid read as praat_short raises a parse error.'''
+    try:
+        audiolabel.LabelManager(
+            from_file='test/this_is_a_label_file.long.TextGrid',
+            from_type='praat_short'
+        )
+    except audiolabel.LabelManagerParseError:
+        pass
+    else:
+        assert False, 'LabelManagerParseError not raised'
+
+def test_tier_extend():
+    labs = [audiolabel.Label(str(t), float(t), float(t + 1)) for t in range(5)]
+    tier = audiolabel.IntervalTier()
+    tier._extend(labs[2:])
+    assert [lab.text for lab in tier] == ['2', '3', '4']
+    assert tier.end == 5.0
+    # Labels that precede existing labels are inserted in order.
+    tier._extend(labs[:2])
+    assert [lab.text for lab in tier] == ['0', '1', '2', '3', '4']
+    assert list(tier._time_buf) == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert tier.label_at(1.5) is labs[1]
+
+def test_wavesurfer():
+    with NamedTemporaryFile('w', suffix='.lab', delete=False) as f:
+        f.write('0.000000 0.250000 sil\n0.250000 0.800000 two words\n')
+    try:
+        lm = audiolabel.LabelManager(from_file=f.name, from_type='wavesurfer')
+    finally:
+        os.remove(f.name)
+    tier = lm.tier(0)
+    assert [lab.text for lab in tier] == ['sil', 'two words']
+    assert tier[1].t1 == 0.25
+    assert tier.end == 0.8
+
+def test_wavesurfer_bad_line():
+    '''Test that blank lines and lines with fewer than three fields raise a
+parse error.'''
+    for content in (
+        '0.000000 0.250000 sil\n\n0.250000 0.800000 two words\n',
+        '0.000000 0.250000 sil\n0.250000 0.800000\n',
+    ):
+        with NamedTemporaryFile('w', suffix='.lab', delete=False) as f:
+            f.write(content)
+        try:
+            audiolabel.LabelManager(from_file=f.name, from_type='wavesurfer')
+        except audiolabel.LabelManagerParseError:
+            pass
+        else:
+            assert False, 'LabelManagerParseError not raised'
+        finally:
+            os.remove(f.name)
+
+def test_praat_single_open():
+    '''Test that a Praat file is opened once per read.'''
+    from unittest import mock
+    with open('test/Turkmen_NA_20130919_G_3.TextGrid', 'rb') as f:
+        raw = f.read()
+    with NamedTemporaryFile('wb', suffix='.TextGrid', delete=False) as f:
+        f.write(raw)
+    try:
+        with mock.patch('builtins.open', wraps=open) as mopen:
+            lm = audiolabel.LabelManager(from_file=f.name, from_type='praat')
+            assert mopen.call_count == 1
+            assert lm.codec == 'utf_16_be'
+            audiolabel.LabelManager(from_file=f.name, from_type='praat')
+            assert mopen.call_count == 2
+    finally:
+        os.remove(f.name)
+
+def test_search():
+    lm = audiolabel.LabelManager(
+        from_file='test/this_is_a_label_file.long.TextGrid',
+        from_type='praat'
+    )
+    tier = lm.tier('word')
+    assert [l.text for l in tier.search('a')] == ['a', 'label']
+    matches = tier.search(r'^i', return_match=True)
+    assert len(matches) == 1
+    assert matches[0][0].text == 'is'
+    assert matches[0][1].group(0) == 'i'
+
+def test_tier_membership():
+    tier = audiolabel.PointTier()
+    labs = [audiolabel.Label(str(n), float(n // 2)) for n in range(6)]
+    for lab in labs:
+        tier.add(lab)
+    assert all(lab in tier for lab in labs)
+    assert audiolabel.Label('0', 0.0) not in tier
+    assert 'text' not in tier
+    assert tier.next(tier[0]) is tier[1]
+    assert tier.prev(tier[3]) is tier[2]
+    tier.discard(labs[2])
+    assert labs[2] not in tier
+    assert len(tier) == 5
+    assert list(tier._time_buf) == [0.0, 0.0, 1.0, 2.0, 2.0]
+
+def test_shift_by_shared_label():
+    '''Test that shifts of a shared label through two tiers add up.'''
+    lab = audiolabel.Label('a', 1.0, 2.0)
+    tier1 = audiolabel.IntervalTier()
+    tier2 = audiolabel.IntervalTier()
+    tier1.add(lab)
+    tier2.add(lab)
+    tier1.shift_by(5)
+    tier2.shift_by(1)
+    assert(lab.t1 == 7.0)
+    assert(lab.t2 == 8.0)
+    tier1.scale_by(2)
+    assert(lab.t1 == 14.0)
+    assert(lab.t2 == 16.0)
+
+def test_tslice_shared_label():
+    '''Test that queries use the current times of a label shared between
+tiers.'''
+    lab = audiolabel.Label('a', 1.0, 2.0)
+    tier1 = audiolabel.IntervalTier()
+    tier2 = audiolabel.IntervalTier()
+    tier1.add(lab)
+    tier2.add(lab)
+    tier1.shift_by(5)
+    assert(tier2.tslice(5.5, 6.5) == [lab])
+    assert(tier2.label_at(6.5) is lab)
+    tier2.shift_by(1)
+    assert(tier1.tslice(6, 6.5) == [])
+    assert(tier1.tslice(7.5, 7.75) == [lab])
+    assert(tier1.labels_at_times([7.5]) == [lab])
+    assert(lab in tier1)
+    pt = audiolabel.PointTier()
+    pt.add(lab)
+    tier1.shift_by(1)
+    assert(pt.tslice(8.0) is lab)
+    assert(pt.label_at(8.1) is lab)
+
+def test_esps_shared_text():
+    '''Test that repeated label texts share one str object.'''
+    lm = audiolabel.LabelManager(
+        from_file='test/sample.esps',
+        from_type='esps'
+    )
+    assert lm.tier(0)[1].text == 'IVER'
+    assert lm.tier(0)[4].text is lm.tier(0)[1].text
+
+def test_scale_by_bad_factor():
+    '''Test that the tier can still be changed after a bad scale_by() or
+shift_by() argument.'''
+    tier = audiolabel.IntervalTier()
+    tier.add(audiolabel.Label('a', 1.0, 2.0))
+    errs = []  # Keep the tracebacks alive, as an interactive session does.
+    for meth in (tier.scale_by, tier.shift_by):
+        try:
+            meth(None)
+        except TypeError as e:
+            errs.append(e)
+        else:
+            assert False
+    tier.add(audiolabel.Label('b', 2.0, 3.0))
+    tier.discard(tier[0])
+    assert(len(tier) == 1)
+    assert(tier[0].t1 == 2.0)
+
 if __name__ == '__main__':
     test_initialization()
     test_praat_long()
@@ -678,3 +1051,29 @@ if __name__ == '__main__':
     test_df2tg_praat_short()
     test_df2tg_praat_long()
     test_df2tg_df_degap()
+    test_labels_at()
+    test_as_string_after_changes()
+    test_as_string_shared_label()
+    test_tier_cast()
+    test_tier_cast_label_subclass()
+    test_labels_at_times()
+    test_labels_at_times_negative_scale()
+    test_repr()
+    test_table_t1_t2()
+    test_table_binary_handle()
+    test_table_header_only()
+    test_table_multichar_sep()
+    test_table_extra_fields()
+    test_table_short_first_row()
+    test_table_t1_step()
+    test_praat_short_wrong_format()
+    test_tier_extend()
+    test_wavesurfer()
+    test_wavesurfer_bad_line()
+    test_praat_single_open()
+    test_search()
+    test_tier_membership()
+    test_shift_by_shared_label()
+    test_tslice_shared_label()
+    test_esps_shared_text()
+    test_scale_by_bad_factor()